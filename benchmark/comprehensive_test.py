@@ -57,7 +57,7 @@ def run_comprehensive_tests():
             integrity_ok = (test_data == decompressed)
             
             # Calculate stats
-            stats = compressor.get_compression_stats(test_data, compressed)
+            stats = compressor.get_compression_stats(test_data, compressed, include_compressed_entropy=False)
             
             result = {
                 'size': size,
@@ -99,7 +99,7 @@ def run_comprehensive_tests():
         integrity_ok = (test_data == decompressed)
         
         # Calculate compression stats
-        stats = compressor.get_compression_stats(test_data, compressed)
+        stats = compressor.get_compression_stats(test_data, compressed, include_compressed_entropy=False)
         
         result = {
             'size': size,
@@ -176,7 +176,7 @@ def run_comprehensive_tests():
             integrity_ok = (test_data == decompressed)
             
             if len(test_data) > 0:
-                stats = compressor.get_compression_stats(test_data, compressed)
+                stats = compressor.get_compression_stats(test_data, compressed, include_compressed_entropy=False)
                 ratio = stats['compression_ratio']
             else:
                 ratio = 0.0
@@ -94,7 +94,8 @@ def run_large_file_tests():
                 compression_time = time.time() - start_time
                 
                 # Calculate compression stats
-                stats = compressor.get_compression_stats(test_data, compressed_data)
+                stats = compressor.get_compression_stats(test_data, compressed_data,
+                                                         include_compressed_entropy=False)
                 
                 print("  Decompressing...")
                 start_time = time.time()
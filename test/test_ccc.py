@@ -76,7 +76,24 @@ class TestCircularChromosomeCompressor(unittest.TestCase):
         
         # Should match original
         self.assertEqual(decompressed, dna_seq)
-    
+
+    def test_dvnp_decompression_invalid_codes(self):
+        """Test that corrupt code streams raise in strict mode."""
+        dna_seq = str(self.compressor.binary_to_dna(self.repeated_data))
+        compressed = self.compressor.dvnp_compress(dna_seq)
+
+        # Negative codes must not be resolved via negative list indexing
+        corrupted = list(compressed)
+        corrupted[len(corrupted) // 2] = -2
+        with self.assertRaises(ValueError):
+            self.compressor.dvnp_decompress(corrupted)
+
+        # Codes beyond the dictionary are equally invalid
+        corrupted = list(compressed)
+        corrupted[len(corrupted) // 2] = 60000
+        with self.assertRaises(ValueError):
+            self.compressor.dvnp_decompress(corrupted)
+
     def test_circular_encapsulation(self):
         """Test circular encapsulation functionality."""
         test_list = list(range(100))  # Simple test data
@@ -344,7 +361,29 @@ class TestHelperFunctions(unittest.TestCase):
             
         for seq in invalid_sequences:
             self.assertFalse(helpers.validate_dna_sequence(seq))
-    
+
+    def test_dna_sequence_validation_modes(self):
+        """Test IUPAC and gapped validation modes."""
+        # Ambiguity codes pass under 'iupac' but not under 'strict'
+        for seq in ["ACGTN", "ACGTR", "acgtn", "RYSWKMBDHVN"]:
+            self.assertTrue(helpers.validate_dna_sequence(seq, mode='iupac'))
+            self.assertFalse(helpers.validate_dna_sequence(seq, mode='strict'))
+
+        # Gap/alignment symbols only pass under 'iupac_gap'
+        for seq in ["ACGT-N", "ACG.T", "AC GT"]:
+            self.assertTrue(helpers.validate_dna_sequence(seq, mode='iupac_gap'))
+            self.assertFalse(helpers.validate_dna_sequence(seq, mode='iupac'))
+            self.assertFalse(helpers.validate_dna_sequence(seq, mode='strict'))
+
+        # Truly invalid characters fail in every mode
+        for mode in ['strict', 'iupac', 'iupac_gap']:
+            self.assertFalse(helpers.validate_dna_sequence("ACGTX", mode=mode))
+            self.assertFalse(helpers.validate_dna_sequence("123", mode=mode))
+
+        # Unknown modes raise rather than silently validating
+        with self.assertRaises(ValueError):
+            helpers.validate_dna_sequence("ACGT", mode='bogus')
+
     def test_gc_content_calculation(self):
         """Test GC content calculation."""
         test_cases = [
@@ -380,7 +419,23 @@ class TestHelperFunctions(unittest.TestCase):
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
-    
+
+    def test_code_packing_roundtrip(self):
+        """Test pack_codes/unpack_codes roundtrip and wire format size."""
+        # Include a code above 16 bits (marker codes can exceed 65535)
+        test_codes = [0, 1, 255, 65535, 65536, 100000]
+
+        packed = self.compressor.pack_codes(test_codes)
+        self.assertIsInstance(packed, bytes)
+        self.assertEqual(len(packed), 4 * len(test_codes))
+
+        unpacked = self.compressor.unpack_codes(packed)
+        self.assertEqual(unpacked, test_codes)
+
+        # Empty code stream packs to an empty buffer
+        self.assertEqual(self.compressor.pack_codes([]), b"")
+        self.assertEqual(self.compressor.unpack_codes(b""), [])
+
     def test_compression_efficiency_analysis(self):
         """Test compression efficiency analysis."""
         result = helpers.analyze_compression_efficiency(1000, 500, 250)
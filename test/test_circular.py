@@ -3,10 +3,14 @@
 Test circular encapsulation and trans-splicing to isolate the issue.
 """
 
+import array
 import sys
 import os
+from itertools import filterfalse
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+
 from utils.circular_chromosome_compression import CircularChromosomeCompressor
 
 def test_circular_and_markers():
@@ -27,7 +31,7 @@ def test_circular_and_markers():
     print(f"DNA length: {len(dna_seq)}")
     
     # Step 2: DVNP compression
-    compressed, dvnp_dict = compressor.dvnp_compress(str(dna_seq))
+    compressed = compressor.dvnp_compress(str(dna_seq))
     print(f"DVNP compressed: {len(compressed)} codes")
     
     # Step 3: Circular encapsulation
@@ -47,9 +51,9 @@ def test_circular_and_markers():
     
     # Step 5: Test the reverse process
     
-    # Remove markers
+    # Remove markers with C-level iteration instead of a list comprehension
     marker_code = ts_metadata.get('sl_marker_code', 0)
-    filtered_data = [x for x in final_data if x != marker_code]
+    filtered_data = array.array('i', filterfalse(marker_code.__eq__, array.array('i', final_data)))
     print(f"After removing markers: {len(filtered_data)} codes")
     
     # Remove circular encapsulation
@@ -67,7 +71,10 @@ def test_circular_and_markers():
             recovered_compressed_2 = filtered_data[:original_compressed_length]
     else:
         recovered_compressed_2 = filtered_data[:original_compressed_length]
-    
+
+    # Back to a plain list for comparison against the compressed stream
+    recovered_compressed_2 = recovered_compressed_2.tolist()
+
     print(f"Recovered compressed length: {len(recovered_compressed_2)}")
     print(f"Matches original compressed: {recovered_compressed_2 == compressed}")
     
@@ -75,18 +82,18 @@ def test_circular_and_markers():
         print("❌ Cannot recover original compressed data!")
         print(f"Expected length: {len(compressed)}")
         print(f"Got length: {len(recovered_compressed_2)}")
-        
-        # Find first difference
+
+        # Find first difference with one vectorized compare
         min_len = min(len(compressed), len(recovered_compressed_2))
-        for i in range(min_len):
-            if compressed[i] != recovered_compressed_2[i]:
-                print(f"First difference at index {i}: expected {compressed[i]}, got {recovered_compressed_2[i]}")
-                break
-        
+        diff = np.flatnonzero(np.asarray(compressed[:min_len]) != np.asarray(recovered_compressed_2[:min_len]))
+        if diff.size:
+            i = int(diff[0])
+            print(f"First difference at index {i}: expected {compressed[i]}, got {recovered_compressed_2[i]}")
+
         return False
-    
+
     # Step 6: DVNP decompress
-    decompressed_dna = compressor.dvnp_decompress(recovered_compressed_2, dvnp_dict)
+    decompressed_dna = compressor.dvnp_decompress(recovered_compressed_2)
     print(f"DVNP decompressed DNA length: {len(decompressed_dna)}")
     print(f"DNA matches: {str(dna_seq) == decompressed_dna}")
     
@@ -110,11 +117,14 @@ def test_circular_and_markers():
     
     if final_binary != original_bytes:
         print("❌ Final binary doesn't match!")
-        # Find first difference
-        for i, (orig, final) in enumerate(zip(original_bytes, final_binary)):
-            if orig != final:
-                print(f"First difference at byte {i}: expected {orig}, got {final}")
-                break
+        # Find first difference with one vectorized compare
+        a = np.frombuffer(original_bytes, dtype=np.uint8)
+        b = np.frombuffer(final_binary, dtype=np.uint8)
+        n = min(a.size, b.size)
+        diff = np.flatnonzero(a[:n] != b[:n])
+        if diff.size:
+            i = int(diff[0])
+            print(f"First difference at byte {i}: expected {original_bytes[i]}, got {final_binary[i]}")
         return False
     
     print("✓ All steps successful!")
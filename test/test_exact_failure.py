@@ -7,6 +7,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+
 from utils.circular_chromosome_compression import CircularChromosomeCompressor
 
 def test_exact_failing_pattern():
@@ -27,67 +29,41 @@ def test_exact_failing_pattern():
     compressed_data, metadata = compressor.compress(original_bytes)
     print(f"Compressed data length: {len(compressed_data)}")
     print(f"Metadata: {metadata}")
-    
-    # Manual decompression process (following the exact same steps as decompress method)
-    ts_metadata = metadata.get('trans_splicing', {})
-    marker_code = ts_metadata.get('sl_marker_code', 0)
-    
+
+    # Manual decompression using the same stage helpers decompress() composes,
+    # so each stage runs exactly once instead of being re-implemented here
+    ts_metadata = metadata['encapsulation']['trans_splicing']
+    marker_code = ts_metadata['sl_marker_code']
+
     print(f"\nMarker code: {marker_code}")
-    
-    # Filter out markers
-    filtered_data = [x for x in compressed_data if x != marker_code]
-    print(f"After removing markers: {len(filtered_data)} codes")
-    
-    # Remove bridge elements and zero padding from circular encapsulation
-    original_length = ts_metadata.get('original_length', len(filtered_data))
-    original_compressed_length = ts_metadata.get('original_compressed_length', original_length)
-    
-    print(f"Original length from metadata: {original_length}")
-    print(f"Original compressed length from metadata: {original_compressed_length}")
-    
-    if original_length <= len(filtered_data):
-        encapsulated_data = filtered_data[:original_length]
-        print(f"Encapsulated data length: {len(encapsulated_data)}")
-        
-        # Extract only the original compressed data, excluding zero padding and bridge elements
-        if original_compressed_length <= len(encapsulated_data):
-            circular_data = encapsulated_data[:original_compressed_length]
-        else:
-            print(f"Warning: original_compressed_length ({original_compressed_length}) > encapsulated_data length ({len(encapsulated_data)})")
-            circular_data = encapsulated_data
-    else:
-        print(f"Warning: original_length ({original_length}) > filtered_data length ({len(filtered_data)})")
-        circular_data = filtered_data[:original_compressed_length] if original_compressed_length <= len(filtered_data) else filtered_data
-    
+
+    # Stage 1: marker filter + circular padding/bridge strip
+    encapsulated_data, circular_data, consistent = compressor._strip_markers_and_padding(
+        compressed_data, marker_code,
+        ts_metadata['original_length'],
+        ts_metadata['original_compressed_length'])
+
+    print(f"Encapsulated data length: {len(encapsulated_data)}")
+    print(f"Lengths consistent: {consistent}")
     print(f"Circular data for DVNP: {len(circular_data)} codes")
-    
-    # DVNP decompression
-    dvnp_dict = metadata.get('dvnp_dictionary', {})
-    print(f"DVNP dictionary: {dvnp_dict}")
-    
+
+    # Stage 2: DVNP decompression
     try:
-        dna_sequence = compressor.dvnp_decompress(circular_data, dvnp_dict)
+        dna_sequence = compressor.dvnp_decompress(circular_data.tolist())
         print(f"DVNP decompressed DNA length: {len(dna_sequence)}")
     except Exception as e:
         print(f"❌ DVNP decompression failed: {e}")
         return False
-    
-    # Convert DNA back to binary
+
+    # Stage 3: Convert DNA back to binary
     binary_data_recovered = compressor.dna_to_binary(dna_sequence)
     print(f"Recovered binary length: {len(binary_data_recovered)}")
-    
-    # Ensure exact original length
-    expected_size = metadata.get('original_size', len(original_bytes))
+
+    # Stage 4: Ensure exact original length
+    expected_size = metadata['core']['original_size']
     print(f"Expected size from metadata: {expected_size}")
-    
-    if len(binary_data_recovered) > expected_size:
-        print(f"Truncating from {len(binary_data_recovered)} to {expected_size}")
-        binary_data_recovered = binary_data_recovered[:expected_size]
-    elif len(binary_data_recovered) < expected_size:
-        padding_needed = expected_size - len(binary_data_recovered)
-        print(f"Padding with {padding_needed} zero bytes")
-        binary_data_recovered = binary_data_recovered + b'\x00' * padding_needed
-    
+
+    binary_data_recovered = compressor._fit_to_size(binary_data_recovered, expected_size)
     print(f"Final binary length: {len(binary_data_recovered)}")
     
     # Compare
@@ -95,13 +71,16 @@ def test_exact_failing_pattern():
     print(f"Manual decompression matches: {matches}")
     
     if not matches:
-        # Find first difference
-        for i, (orig, recovered) in enumerate(zip(original_bytes, binary_data_recovered)):
-            if orig != recovered:
-                print(f"First difference at byte {i}: expected {orig}, got {recovered}")
-                print(f"Original context: {original_bytes[max(0,i-5):i+5]}")
-                print(f"Recovered context: {binary_data_recovered[max(0,i-5):i+5]}")
-                break
+        # Find first difference with one vectorized compare
+        a = np.frombuffer(original_bytes, dtype=np.uint8)
+        b = np.frombuffer(binary_data_recovered, dtype=np.uint8)
+        n = min(a.size, b.size)
+        diff = np.flatnonzero(a[:n] != b[:n])
+        if diff.size:
+            i = int(diff[0])
+            print(f"First difference at byte {i}: expected {original_bytes[i]}, got {binary_data_recovered[i]}")
+            print(f"Original context: {original_bytes[max(0,i-5):i+5]}")
+            print(f"Recovered context: {binary_data_recovered[max(0,i-5):i+5]}")
     
     # Now test the automatic decompression
     auto_decompressed = compressor.decompress(compressed_data, metadata)
@@ -6,6 +6,7 @@ Test hash verification and data integrity checking functionality.
 import unittest
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to the path to import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,10 +17,15 @@ from utils.circular_chromosome_compression import CircularChromosomeCompressor
 class TestHashVerification(unittest.TestCase):
     """Test hash verification and data integrity checking."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.compressor_strict = CircularChromosomeCompressor(strict_mode=True, verbose=True)
-        self.compressor_lenient = CircularChromosomeCompressor(strict_mode=False, verbose=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the class.
+
+        The compressors are read-only across these tests, so one instance
+        per mode serves every test method.
+        """
+        cls.compressor_strict = CircularChromosomeCompressor(strict_mode=True, verbose=True)
+        cls.compressor_lenient = CircularChromosomeCompressor(strict_mode=False, verbose=True)
     
     def test_hash_computation(self):
         """Test basic hash computation functionality."""
@@ -96,7 +102,7 @@ class TestHashVerification(unittest.TestCase):
         
         # Decompress should succeed with correct metadata
         decompressed = self.compressor_strict.decompress(compressed, metadata)
-        self.assertEqual(test_data, decompressed)
+        self.assertEqual(bytes(test_data), bytes(decompressed))
     
     def test_end_to_end_integrity_check_failure(self):
         """Test end-to-end decompression with corrupted hash."""
@@ -127,7 +133,7 @@ class TestHashVerification(unittest.TestCase):
         
         # Decompression should succeed in lenient mode despite hash mismatch
         decompressed = self.compressor_lenient.decompress(compressed, metadata)
-        self.assertEqual(test_data, decompressed)
+        self.assertEqual(bytes(test_data), bytes(decompressed))
     
     def test_integrity_check_with_different_data_sizes(self):
         """Test integrity checking with different data sizes."""
@@ -139,15 +145,23 @@ class TestHashVerification(unittest.TestCase):
             bytes(range(256)),  # All byte values
         ]
         
-        for test_data in test_cases:
+        def _roundtrip(data):
+            # Each worker uses its own compressor; compress stores per-call
+            # state on the instance, so sharing one across threads would race
+            compressor = CircularChromosomeCompressor(strict_mode=True, verbose=True)
+            compressed, metadata = compressor.compress(data)
+            return compressor.decompress(compressed, metadata), metadata
+
+        # The cases are independent, so run the roundtrips concurrently and
+        # keep the assertions on the main thread
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(_roundtrip, test_cases))
+
+        for test_data, (decompressed, metadata) in zip(test_cases, results):
             with self.subTest(data_size=len(test_data)):
-                # Compress and decompress
-                compressed, metadata = self.compressor_strict.compress(test_data)
-                decompressed = self.compressor_strict.decompress(compressed, metadata)
-                
                 # Verify integrity maintained
-                self.assertEqual(test_data, decompressed)
-                
+                self.assertEqual(bytes(test_data), bytes(decompressed))
+
                 # Verify hash is present
                 hash_value = metadata['encapsulation']['trans_splicing']['data_hash']
                 self.assertEqual(len(hash_value), 8)
@@ -7,6 +7,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+
 from utils.circular_chromosome_compression import CircularChromosomeCompressor
 
 def test_lzw_algorithm():
@@ -26,12 +28,11 @@ def test_lzw_algorithm():
         print(f"\nTesting: {seq}")
         
         # Compress
-        compressed, dictionary = compressor.dvnp_compress(seq)
+        compressed = compressor.dvnp_compress(seq)
         print(f"Compressed: {compressed}")
-        print(f"Dictionary: {dictionary}")
-        
+
         # Decompress
-        decompressed = compressor.dvnp_decompress(compressed, dictionary)
+        decompressed = compressor.dvnp_decompress(compressed)
         print(f"Decompressed: {decompressed}")
         
         # Check
@@ -57,21 +58,24 @@ def test_lzw_algorithm():
     dna_seq = compressor.binary_to_dna(bytes(binary_data))
     print(f"DNA sequence length: {len(dna_seq)}")
     
-    compressed, dictionary = compressor.dvnp_compress(str(dna_seq))
-    decompressed = compressor.dvnp_decompress(compressed, dictionary)
+    compressed = compressor.dvnp_compress(str(dna_seq))
+    decompressed = compressor.dvnp_decompress(compressed)
     
     matches = str(dna_seq) == decompressed
     print(f"LZW Match: {matches}")
     
     if not matches:
         print("❌ LZW fails on this pattern!")
-        # Find where it differs
-        for i, (orig, decomp) in enumerate(zip(str(dna_seq), decompressed)):
-            if orig != decomp:
-                print(f"First difference at position {i}: expected '{orig}', got '{decomp}'")
-                print(f"Context: {str(dna_seq)[max(0,i-10):i+10]}")
-                print(f"         {decompressed[max(0,i-10):i+10]}")
-                break
+        # Find where it differs with one vectorized compare
+        a = np.frombuffer(str(dna_seq).encode(), dtype=np.uint8)
+        b = np.frombuffer(decompressed.encode(), dtype=np.uint8)
+        n = min(a.size, b.size)
+        diff = np.flatnonzero(a[:n] != b[:n])
+        if diff.size:
+            i = int(diff[0])
+            print(f"First difference at position {i}: expected '{str(dna_seq)[i]}', got '{decompressed[i]}'")
+            print(f"Context: {str(dna_seq)[max(0,i-10):i+10]}")
+            print(f"         {decompressed[max(0,i-10):i+10]}")
         return False
     
     print("✓ LZW works on this pattern!")
@@ -7,6 +7,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+
 from utils.circular_chromosome_compression import CircularChromosomeCompressor
 
 def test_marker_conflict():
@@ -22,23 +24,28 @@ def test_marker_conflict():
     
     # Step through compression to get circular data
     dna_seq = compressor.binary_to_dna(original_bytes)
-    compressed, dvnp_dict = compressor.dvnp_compress(str(dna_seq))
+    compressed = compressor.dvnp_compress(str(dna_seq))
     circular_data = compressor.circular_encapsulate(compressed)
     
+    # One np.unique pass yields min, max and unique count together instead
+    # of separate min()/max()/set() walks over the same codes
+    uniq = np.unique(np.asarray(circular_data))
     print(f"Circular data length: {len(circular_data)}")
-    print(f"Circular data range: {min(circular_data)} to {max(circular_data)}")
-    print(f"Unique values in circular data: {len(set(circular_data))}")
+    print(f"Circular data range: {uniq[0]} to {uniq[-1]}")
+    print(f"Unique values in circular data: {uniq.size}")
     
     # Generate marker
     final_data, ts_metadata = compressor.add_trans_splicing_markers(circular_data, len(compressed))
     marker_code = ts_metadata['sl_marker_code']
     
     print(f"Marker code: {marker_code}")
-    print(f"Marker code in circular data: {marker_code in circular_data}")
-    
-    if marker_code in circular_data:
+
+    # Single vectorized pass instead of separate `in` and `.count()` scans
+    count_in_data = compressor._marker_conflict_scan(circular_data, marker_code)
+    print(f"Marker code in circular data: {count_in_data > 0}")
+
+    if count_in_data > 0:
         print(f"❌ CONFLICT! Marker code {marker_code} appears in actual data!")
-        count_in_data = circular_data.count(marker_code)
         print(f"Marker code appears {count_in_data} times in circular data")
         
         # This will cause data loss during decompression
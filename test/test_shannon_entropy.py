@@ -9,6 +9,8 @@ import sys
 import os
 import math
 
+import numpy as np
+
 # Add the parent directory to the path to import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -17,10 +19,11 @@ from utils.circular_chromosome_compression import CircularChromosomeCompressor
 
 class TestShannonEntropy(unittest.TestCase):
     """Test Shannon entropy calculation and analysis features."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.compressor = CircularChromosomeCompressor()
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared compressor once; entropy analysis is read-only."""
+        cls.compressor = CircularChromosomeCompressor()
     
     def test_entropy_calculation_uniform_data(self):
         """Test entropy calculation for uniform data (should be maximum)."""
@@ -159,10 +162,11 @@ class TestShannonEntropy(unittest.TestCase):
 
 class TestEntropyIntegration(unittest.TestCase):
     """Test integration of entropy analysis with compression pipeline."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.compressor = CircularChromosomeCompressor()
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared compressor once; entropy analysis is read-only."""
+        cls.compressor = CircularChromosomeCompressor()
     
     def test_entropy_preserved_in_compression_stats(self):
         """Test that entropy information is included in compression statistics."""
@@ -189,18 +193,13 @@ class TestEntropyIntegration(unittest.TestCase):
         # Analyze entropy at each stage
         original_entropy = self.compressor._entropy(test_data)
         
-        # Convert compressed integer codes to bytes properly
-        core_bytes = []
-        for code in core_compressed:
-            code_bytes = code.to_bytes((code.bit_length() + 7) // 8 or 1, 'little')
-            core_bytes.extend(code_bytes)
-        core_entropy = self.compressor._entropy(bytes(core_bytes))
-        
-        full_bytes = []
-        for code in full_compressed:
-            code_bytes = code.to_bytes((code.bit_length() + 7) // 8 or 1, 'little')
-            full_bytes.extend(code_bytes)
-        full_entropy = self.compressor._entropy(bytes(full_bytes))
+        # Convert compressed integer codes to bytes in one vectorized pack
+        # (all LZW codes fit in 32 bits, so fixed-width little-endian works)
+        core_bytes = np.asarray(core_compressed, dtype='<u4').tobytes()
+        core_entropy = self.compressor._entropy(core_bytes)
+
+        full_bytes = np.asarray(full_compressed, dtype='<u4').tobytes()
+        full_entropy = self.compressor._entropy(full_bytes)
         
         # Verify entropy generally decreases through pipeline
         # (though encapsulation might add some entropy back)
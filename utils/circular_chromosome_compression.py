@@ -6,20 +6,72 @@ This algorithm converts binary data to DNA sequences using circular structure
 to optimize storage density and enable efficient access patterns.
 """
 
+import array
+import functools
 import hashlib
+import hmac
 import math
-from collections import Counter
-from typing import List, Dict, Tuple, Optional
+import zlib
+from typing import List, Dict, Tuple, Optional, Union
+
+import numpy as np
 from Bio.Seq import Seq
 
+# Translation table mapping ASCII 'A'/'C'/'G'/'T' to the 2-bit codes 0-3.
+# Any other byte maps to 0xFF so invalid bases can be detected in one scan.
+_DNA_CODE_TABLE = bytes(
+    b'ACGT'.index(bytes([i])) if i in b'ACGT' else 0xFF for i in range(256)
+)
+
+# NumPy view of the same table for vectorized gathers.
+_DNA_CODE_LUT = np.frombuffer(_DNA_CODE_TABLE, dtype=np.uint8)
+
+# 256-entry lookup table mapping each byte value to its 4-base DNA encoding
+# (2 bits per base, most significant pair first), built once at import time.
+_BYTE_TO_DNA = np.array(
+    [
+        ''.join('ACGT'[(i >> shift) & 0b11] for shift in (6, 4, 2, 0)).encode('ascii')
+        for i in range(256)
+    ],
+    dtype='|S4',
+)
+
+
+# Number of codes hashed per chunk when streaming large code lists, chosen so
+# each packed chunk (32 KiB) stays cache-resident without a full copy of the
+# stream being materialized.
+_HASH_CHUNK_CODES = 8192
+
+
+@functools.lru_cache(maxsize=256)
+def _crc32_hex(buf: bytes) -> str:
+    """Memoized CRC32 of a raw code buffer, formatted as 8 hex characters.
+
+    The checksum is a pure function of its content-addressed key, so
+    re-verifying the same block (common in integrity checks) is a cache hit.
+    """
+    return f"{zlib.crc32(buf):08x}"
+
 
 class CircularChromosomeCompressor:
     """
     Implements the Circular Chromosome Compression algorithm inspired by
     dinoflagellate chromosomes with DVNP-like compression and trans-splicing.
     """
-    
-    def __init__(self, chunk_size: int = 1000, min_pattern_length: int = 4, 
+
+    # Known instance fields only: dropping the per-instance __dict__ shaves
+    # instance size and makes any accidental state smuggling an AttributeError
+    __slots__ = ('chunk_size', 'min_pattern_length', 'strict_mode', 'verbose',
+                 '_base_primes', '_sieve_limit', '_original_bits_length')
+
+    # Immutable encoding tables shared by all instances; built once at class
+    # creation so per-instance construction is just field assignment.
+    base_mapping = {'00': 'A', '01': 'C', '10': 'G', '11': 'T'}
+    reverse_mapping = {'A': '00', 'C': '01', 'G': '10', 'T': '11'}
+    # Fixed base dictionary for DVNP compression/decompression symmetry
+    _base_dict = {0: 'A', 1: 'C', 2: 'G', 3: 'T'}
+
+    def __init__(self, chunk_size: int = 1000, min_pattern_length: int = 4,
                  strict_mode: bool = True, verbose: bool = False):
         """
         Initialize the compressor with configuration parameters.
@@ -34,11 +86,9 @@ class CircularChromosomeCompressor:
         self.min_pattern_length = min_pattern_length
         self.strict_mode = strict_mode
         self.verbose = verbose
-        self.base_mapping = {'00': 'A', '01': 'C', '10': 'G', '11': 'T'}
-        self.reverse_mapping = {'A': '00', 'C': '01', 'G': '10', 'T': '11'}
-        # Fixed base dictionary for DVNP compression/decompression symmetry
-        self._base_dict = {0: 'A', 1: 'C', 2: 'G', 3: 'T'}
-        
+        self._base_primes = None  # cached sieve primes for _next_prime
+        self._sieve_limit = 0     # bound the cached primes were sieved up to
+
     def _log(self, message: str):
         """Log debug information if verbose mode is enabled."""
         if self.verbose:
@@ -66,38 +116,67 @@ class CircularChromosomeCompressor:
         """
         if not data:
             return 0.0
-        
-        # Count frequency of each byte value
-        freq = Counter(data)
-        total = len(data)
-        
+
+        # Histogram all byte values in one C-level pass
+        arr = np.frombuffer(data, dtype=np.uint8)
+        counts = np.bincount(arr, minlength=256)
+
         # Calculate Shannon entropy: H = -Σ(p * log2(p))
-        # Handle the case where probability = 1 (all data same)
-        entropy = 0.0
-        for count in freq.values():
-            probability = count / total
-            if probability > 0:  # Avoid log(0)
-                entropy -= probability * math.log2(probability)
-        
+        # Only nonzero counts contribute, which also avoids log(0)
+        probabilities = counts[counts > 0].astype(np.float64) / arr.size
+        entropy = float(-(probabilities * np.log2(probabilities)).sum())
+
         self._log(f"Shannon entropy calculated: {entropy:.3f} bits/byte")
         return entropy
     
     def _compute_data_hash(self, data: List[int]) -> str:
         """
-        Compute SHA-256 hash for data integrity verification.
-        
+        Compute CRC32 checksum for data integrity verification.
+
+        The hash is only used for corruption detection, so a hardware-backed
+        CRC32 over the raw code buffer replaces the previous cryptographic
+        digest of a formatted string.
+
         Args:
             data: List of integer codes representing compressed data
-            
+
         Returns:
             8-character hexadecimal hash string
         """
-        if not data:
+        if len(data) == 0:
+            return ""
+
+        if len(data) <= _HASH_CHUNK_CODES:
+            buf = np.asarray(data, dtype=np.uint32).tobytes()
+            return _crc32_hex(buf)
+
+        # Stream long code lists through the CRC in fixed-size chunks so the
+        # whole packed buffer is never materialized alongside the codes
+        crc = 0
+        for start in range(0, len(data), _HASH_CHUNK_CODES):
+            chunk = np.asarray(data[start:start + _HASH_CHUNK_CODES], dtype=np.uint32)
+            crc = zlib.crc32(chunk.tobytes(), crc)
+        return f"{crc:08x}"
+
+    def _compute_legacy_data_hash(self, data: List[int]) -> str:
+        """
+        Compute the pre-CRC32 hash format for backward compatibility.
+
+        Archives written before the CRC32 switch stored a truncated SHA-256
+        of the comma-joined code list; this reproduces that format so
+        _verify_data_integrity() can still accept old saves.
+
+        Args:
+            data: List of integer codes representing compressed data
+
+        Returns:
+            8-character hexadecimal hash string
+        """
+        if len(data) == 0:
             return ""
-        
         data_str = ','.join(str(x) for x in data)
         return hashlib.sha256(data_str.encode('utf-8')).hexdigest()[:8]
-    
+
     def _verify_data_integrity(self, data: List[int], expected_hash: str, operation: str = "decompression") -> bool:
         """
         Verify data integrity using hash comparison.
@@ -115,11 +194,19 @@ class CircularChromosomeCompressor:
             return False
         
         computed_hash = self._compute_data_hash(data)
-        
-        if computed_hash == expected_hash:
+
+        # C-level fixed-length compare; no per-character Python dispatch
+        if hmac.compare_digest(computed_hash, expected_hash):
             self._log(f"[CCC Info] Data integrity verified successfully for {operation}")
             return True
         else:
+            # Archives written before the CRC32 switch stored a truncated
+            # SHA-256 of the comma-joined code list; accept those so old
+            # saves still pass strict-mode verification.
+            legacy_hash = self._compute_legacy_data_hash(data)
+            if hmac.compare_digest(legacy_hash, expected_hash):
+                self._log(f"[CCC Info] Data integrity verified via legacy hash format for {operation}")
+                return True
             error_msg = f"Data integrity check failed during {operation}: hash mismatch (expected {expected_hash}, got {computed_hash})"
             if self.strict_mode:
                 raise ValueError(error_msg)
@@ -129,40 +216,48 @@ class CircularChromosomeCompressor:
                     print(f"[CCC Warning] {error_msg}")
                 return False
         
-    def binary_to_dna(self, binary_data: bytes) -> Seq:
+    def _binary_to_dna_bytes(self, binary_data: bytes) -> bytes:
         """
-        Convert binary data to DNA sequence using 2-bit to base mapping.
-        Inspired by balanced nucleotide distribution in dinoflagellates.
-        
+        Convert binary data to a DNA sequence as raw ASCII bytes.
+
+        Internal hot-path variant of binary_to_dna() that skips the Seq
+        wrapper and the str decode, for callers that immediately feed the
+        sequence into dvnp_compress().
+
         Args:
             binary_data: Input binary data as bytes
-            
+
         Returns:
-            Bio.Seq object containing DNA sequence
+            ASCII bytes of the DNA sequence
         """
         if not self._validate_input(binary_data, "binary_data"):
-            return Seq("")
-            
+            return b""
+
         self._log(f"Converting {len(binary_data)} bytes to DNA sequence")
-            
-        # Convert bytes to binary string
-        bits = ''.join(f'{byte:08b}' for byte in binary_data)
-        
+
         # Store original length for proper reconstruction
-        self._original_bits_length = len(bits)
-        
-        # Pad if length is not even
-        if len(bits) % 2 != 0:
-            bits += '0'
-            
-        # Convert to DNA sequence
-        dna_sequence = ''.join(
-            self.base_mapping[bits[i:i+2]] 
-            for i in range(0, len(bits), 2)
-        )
-        
+        self._original_bits_length = len(binary_data) * 8
+
+        # Gather each byte's 4-base encoding from the precomputed table in a
+        # single vectorized pass instead of formatting a giant bit string
+        arr = np.frombuffer(binary_data, dtype=np.uint8)
+        dna_sequence = _BYTE_TO_DNA[arr].tobytes()
+
         self._log(f"Generated DNA sequence of length {len(dna_sequence)}")
-        return Seq(dna_sequence)
+        return dna_sequence
+
+    def binary_to_dna(self, binary_data: bytes) -> Seq:
+        """
+        Convert binary data to DNA sequence using 2-bit to base mapping.
+        Inspired by balanced nucleotide distribution in dinoflagellates.
+
+        Args:
+            binary_data: Input binary data as bytes
+
+        Returns:
+            Bio.Seq object containing DNA sequence
+        """
+        return Seq(self._binary_to_dna_bytes(binary_data).decode('ascii'))
     
     def dna_to_binary(self, dna_seq: str) -> bytes:
         """
@@ -189,32 +284,39 @@ class CircularChromosomeCompressor:
             else:
                 self._log(f"Warning: {error_msg}, filtering them out")
                 dna_seq = ''.join(base for base in dna_seq.upper() if base in valid_bases)
-            
-        # Convert DNA to binary string
-        try:
-            bits = ''.join(self.reverse_mapping[base.upper()] for base in dna_seq)
-        except KeyError as e:
-            error_msg = f"Invalid DNA base encountered: {e}"
-            if self.strict_mode:
-                raise ValueError(error_msg)
-            else:
-                self._log(f"Warning: {error_msg}")
-                return b""
-        
-        # Convert binary string to bytes
-        byte_array = []
-        for i in range(0, len(bits), 8):
-            byte_chunk = bits[i:i+8]
-            if len(byte_chunk) == 8:
-                byte_array.append(int(byte_chunk, 2))
-            elif len(byte_chunk) > 0:
-                # Handle incomplete byte by padding with zeros
-                padded_chunk = byte_chunk.ljust(8, '0')
-                byte_array.append(int(padded_chunk, 2))
-                
-        return bytes(byte_array)
-        
-    def dvnp_compress(self, dna_seq: str) -> List[int]:
+
+        return self._dna_bases_to_binary(dna_seq.upper().encode('ascii'))
+
+    def _dna_bases_to_binary(self, dna_bytes: bytes) -> bytes:
+        """
+        Pack an already-validated ASCII DNA byte sequence into binary.
+
+        Internal hot-path packer shared by dna_to_binary() and the fused
+        decompression path; callers must guarantee the input contains only
+        uppercase A/C/G/T bytes.
+
+        Args:
+            dna_bytes: ASCII bytes of uppercase DNA bases
+
+        Returns:
+            Packed binary data as bytes
+        """
+        # Gather 2-bit codes for all bases in one vectorized pass
+        arr = np.frombuffer(bytes(dna_bytes), dtype=np.uint8)
+        codes = _DNA_CODE_LUT[arr]
+
+        # Pad to a multiple of 4 bases (zero bits, matching the old
+        # incomplete-byte handling), then pack 4 codes into each byte
+        pad = (-codes.size) % 4
+        if pad:
+            codes = np.concatenate([codes, np.zeros(pad, dtype=np.uint8)])
+
+        quads = codes.reshape(-1, 4)
+        packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+        return packed.astype(np.uint8).tobytes()
+        
+    def dvnp_compress(self, dna_seq: Union[str, bytes, np.ndarray]) -> List[int]:
         """
         DVNP-simulated compression using improved LZW-like algorithm to remove repetitive patterns.
         Inspired by dinoflagellate viral nucleoprotein condensation mechanisms.
@@ -226,139 +328,192 @@ class CircularChromosomeCompressor:
         4. Reduced string concatenation overhead where possible
 
         Args:
-            dna_seq: Input DNA sequence string
+            dna_seq: Input DNA sequence as a string, ASCII bytes, or a uint8
+                ndarray of ASCII codes; byte inputs skip the str re-encode
 
         Returns:
             Compressed sequence as list of integers with reset markers
         """
-        if not self._validate_input(dna_seq, "dna_seq"):
+        # Normalize to ASCII bytes before validation so ndarray inputs are
+        # never truth-tested directly
+        if isinstance(dna_seq, str):
+            raw = dna_seq.encode('ascii')
+        elif isinstance(dna_seq, (bytes, bytearray)):
+            raw = bytes(dna_seq)
+        else:
+            raw = np.asarray(dna_seq, dtype=np.uint8).tobytes()
+
+        if not self._validate_input(raw, "dna_seq"):
             return []
-            
-        self._log(f"Starting DVNP compression on sequence of length {len(dna_seq)}")
-        
-        # Initialize compression parameters
-        dictionary = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+        self._log(f"Starting DVNP compression on sequence of length {len(raw)}")
+
+        # Pre-decode the bases to 2-bit symbol codes in one C-level pass so
+        # the hot loop works purely on small integers instead of building
+        # prefix strings for every dictionary probe.
+        seq_codes = raw.translate(_DNA_CODE_TABLE)
+        if 0xFF in seq_codes:
+            pos = seq_codes.index(0xFF)
+            raise ValueError(f"Invalid DNA base {chr(raw[pos])!r} at position {pos}")
+
+        # Extension dictionary keyed by (prefix_code << 2) | symbol; the four
+        # single-base entries are implicit as codes 0-3.
+        ext_dict = {}
         next_code = 4
-        current = ''
-        result = []
-        
+        current = -1
+        # Build into a C-int array: codes stay unboxed (4 bytes each instead
+        # of a PyObject per element), which keeps the working set small on
+        # long sequences; converted to the public list form on return
+        result = array.array('i')
+
         # Dynamic reset parameters for long sequences
         reset_count = 0
         max_dict_size = 65536
         # Special code to mark dictionary reset - fixed value for consistency
         RESET_MARKER = 65535
-        
-        # Pre-allocate result list with estimated size to reduce reallocations
-        # estimated_size = len(dna_seq) // 4
-        # Note: Python lists don't have reserve() method, this is just a comment
-        
+
         self._log(f"Dynamic dictionary reset enabled for sequences >1M bases")
-        
+
         # Main compression loop with dynamic dictionary reset
-        for ch in dna_seq:
-            combined = current + ch
-            if combined in dictionary:
-                current = combined
+        for sym in seq_codes:
+            if current < 0:
+                current = sym
+                continue
+
+            key = (current << 2) | sym
+            code = ext_dict.get(key)
+            if code is not None:
+                current = code
             else:
-                if current:  # Only append if current is not empty
-                    result.append(dictionary[current])
-                
+                result.append(current)
+
                 # Add new dictionary entry if space available
                 if next_code < max_dict_size:
-                    dictionary[combined] = next_code
+                    ext_dict[key] = next_code
                     next_code += 1
                 else:
                     # Dictionary is full - implement dynamic reset
                     result.append(RESET_MARKER)
                     reset_count += 1
-                    
+
                     # Reset dictionary to initial state
-                    dictionary = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+                    ext_dict.clear()
                     next_code = 4
-                    
+
                     self._log(f"Dictionary reset #{reset_count} at position {len(result) - 1}")
-                    
-                    # After reset, handle the current character combination
-                    # Don't add combined to dictionary yet, just set current
-                current = ch
-        
+
+                    # After reset, don't add the pending combination yet; just
+                    # restart from the current symbol
+                current = sym
+
         # Handle final sequence
-        if current:
-            result.append(dictionary[current])
+        if current >= 0:
+            result.append(current)
 
         compression_ratio = len(result) / len(dna_seq) if len(dna_seq) > 0 else 0
         self._log(f"DVNP compression completed: {len(dna_seq)} chars → {len(result)} codes")
         self._log(f"Dictionary resets: {reset_count}, Final compression ratio: {compression_ratio:.3f}")
-        
-        return result
+
+        return result.tolist()
 
     def dvnp_decompress(self, compressed: List[int]) -> str:
         """
         Decompress the DVNP-compressed sequence using improved LZW decompression.
         Must match compression logic exactly for perfect reconstruction.
         Supports dynamic dictionary reset markers for long sequences.
-        
+
         Args:
             compressed: List of integer codes (may contain reset markers)
-            
+
         Returns:
             Decompressed DNA sequence string
         """
+        return self._dvnp_decompress_bases(compressed).decode('ascii')
+
+    def _dvnp_decompress_bases(self, compressed: List[int]) -> bytearray:
+        """
+        DVNP decompression core emitting the DNA sequence as raw ASCII bytes.
+
+        Internal hot-path variant of dvnp_decompress() for callers that
+        immediately re-encode the sequence (e.g. the binary packer), so the
+        bytes → str → bytes round trip is skipped.
+
+        Args:
+            compressed: List of integer codes (may contain reset markers)
+
+        Returns:
+            ASCII bytes of the decompressed DNA sequence
+        """
         if not self._validate_input(compressed, "compressed codes"):
-            return ""
-            
+            return bytearray()
+
         self._log(f"Starting DVNP decompression on {len(compressed)} codes")
-        
-        # Initialize decompression parameters
-        work_dict = self._base_dict.copy()
+
+        # Initialize decompression parameters.  Every dictionary entry is a
+        # substring of the output produced so far, so instead of building
+        # Python strings (which makes decompression quadratic through
+        # repeated concatenation) each code >= 4 is stored as a
+        # (start, length) span into the output buffer.  The entry for a new
+        # code is always "prev + first char of current entry", and since the
+        # current entry is emitted directly after prev's most recent
+        # occurrence, that is exactly the span (prev_start, prev_len + 1).
+        bases = b'ACGT'
+        out = bytearray()
         next_code = 4
-        result = ""
         reset_count = 0
         max_dict_size = 65536
         RESET_MARKER = 65535  # Match the compression marker
-        
+        starts = [0] * max_dict_size
+        lengths = [0] * max_dict_size
+
         if not compressed:
-            return ""
-        
+            return out
+
         # Handle first code
-        if compressed[0] == RESET_MARKER:
+        first_code = compressed[0]
+        if first_code == RESET_MARKER:
             error_msg = "First code cannot be a reset marker"
             if self.strict_mode:
                 raise ValueError(error_msg)
             else:
                 self._log(f"Warning: {error_msg}")
-                return ""
-        
-        prev = work_dict[compressed[0]]
-        result = prev
-        
+                return out
+        if not 0 <= first_code < 4:
+            error_msg = f"Invalid first code {first_code} in DVNP decompression"
+            if self.strict_mode:
+                raise ValueError(error_msg)
+            else:
+                self._log(f"Warning: {error_msg}")
+                return out
+
+        out.append(bases[first_code])
+        prev_start = 0
+        prev_len = 1
+
         # Process remaining codes with reset marker handling
         i = 1
-        while i < len(compressed):
+        n_codes = len(compressed)
+        while i < n_codes:
             code = compressed[i]
-            
+
             # Check for dictionary reset marker
             if code == RESET_MARKER:
                 reset_count += 1
                 self._log(f"Processing dictionary reset #{reset_count}")
-                
+
                 # Reset dictionary to initial state
-                work_dict = self._base_dict.copy()
                 next_code = 4
-                
+
                 # Move to next code and start fresh
                 i += 1
-                if i >= len(compressed):
-                    break
-                
-                # The next code after reset should be treated as a fresh start
-                if i >= len(compressed):
+                if i >= n_codes:
                     break
-                    
+
                 code = compressed[i]
-                if code in work_dict:
-                    prev = work_dict[code]
-                    result += prev
+                if 0 <= code < 4:
+                    prev_start = len(out)
+                    prev_len = 1
+                    out.append(bases[code])
                     i += 1
                     continue
                 else:
@@ -368,45 +523,98 @@ class CircularChromosomeCompressor:
                     else:
                         self._log(f"Warning: {error_msg}")
                         break
-            
-            # Normal LZW decompression logic
-            if code in work_dict:
-                entry = work_dict[code]
-            elif code == next_code and prev and len(prev) > 0:
+
+            # Normal LZW decompression logic: resolve the code to a span and
+            # emit it by copying the referenced bytes to the end of the buffer
+            if 0 <= code < 4:
+                entry_start = len(out)
+                entry_len = 1
+                out.append(bases[code])
+            elif 4 <= code < next_code:
+                start = starts[code]
+                entry_start = len(out)
+                entry_len = lengths[code]
+                out += out[start:start + entry_len]
+            elif code == next_code:
                 # Special case: code not in dictionary yet, but it's the next code
                 # This happens when we're about to add entry to dictionary
-                entry = prev + prev[0]
+                # (entry = prev + prev[0])
+                entry_start = len(out)
+                entry_len = prev_len + 1
+                out += out[prev_start:prev_start + prev_len]
+                out.append(out[prev_start])
             else:
                 # Handle codes that might be from before a reset
                 # Skip invalid codes gracefully in non-strict mode
-                error_msg = f"Invalid code {code} in DVNP decompression (dict size: {len(work_dict)}, next_code: {next_code})"
+                error_msg = f"Invalid code {code} in DVNP decompression (next_code: {next_code})"
                 if self.strict_mode:
                     raise ValueError(error_msg)
                 else:
                     self._log(f"Warning: {error_msg}, skipping invalid code")
                     i += 1
                     continue
-            
-            result += entry
-            
-            # Add new dictionary entry if space available and prev is valid
-            if next_code < max_dict_size and prev and len(prev) > 0 and len(entry) > 0:
-                work_dict[next_code] = prev + entry[0]
+
+            # Add new dictionary entry if space available: prev + entry[0],
+            # which is the span covering prev's last emission plus one byte
+            if next_code < max_dict_size:
+                starts[next_code] = prev_start
+                lengths[next_code] = prev_len + 1
                 next_code += 1
-            
-            prev = entry
+
+            prev_start = entry_start
+            prev_len = entry_len
             i += 1
-        
-        self._log(f"DVNP decompression completed: {len(compressed)} codes → {len(result)} chars")
+
+        self._log(f"DVNP decompression completed: {len(compressed)} codes → {len(out)} chars")
         self._log(f"Dictionary resets processed: {reset_count}")
-        
-        return result
+
+        return out
         
     def _next_prime(self, n: int) -> int:
-        """Find the next prime number greater than or equal to n."""
+        """Find the next prime number greater than or equal to n.
+
+        Sieves a small window [n, n + gap) against cached base primes
+        instead of trial-dividing every candidate; prime gaps in this
+        range are far below the window size, so one window suffices for
+        realistic inputs with a trial-division fallback just in case.
+        """
         if n < 2:
             return 2
-        
+
+        window = 400
+        limit = math.isqrt(n + window) + 1
+        base_primes = self._base_primes
+        # Compare against the sieved bound, not the largest prime found:
+        # the largest prime below limit is almost never limit itself, so
+        # that comparison would rebuild the table on every call
+        if base_primes is None or self._sieve_limit < limit:
+            # (Re)build the base-prime table with a sieve of Eratosthenes;
+            # isqrt grows slowly, so this is amortized across many calls
+            sieve = np.ones(limit + 1, dtype=bool)
+            sieve[:2] = False
+            for p in range(2, math.isqrt(limit) + 1):
+                if sieve[p]:
+                    sieve[p * p::p] = False
+            base_primes = np.flatnonzero(sieve)
+            self._base_primes = base_primes
+            self._sieve_limit = limit
+
+        # Mark composites in the candidate window by each base prime
+        candidates = np.arange(n, n + window, dtype=np.int64)
+        is_prime = np.ones(window, dtype=bool)
+        for p in base_primes[base_primes * base_primes <= candidates[-1]]:
+            p = int(p)
+            first = -n % p
+            if n + first == p:  # don't mark the prime itself
+                first += p
+            is_prime[first::p] = False
+
+        hits = np.flatnonzero(is_prime)
+        if hits.size:
+            return int(candidates[hits[0]])
+
+        # Extremely unlikely: no prime in the window, fall back to scanning
+        n += window
         while not self._is_prime(n):
             n += 1
         return n
@@ -420,7 +628,7 @@ class CircularChromosomeCompressor:
         if n % 2 == 0:
             return False
         
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
+        for i in range(3, math.isqrt(n) + 1, 2):
             if n % i == 0:
                 return False
         return True
@@ -445,24 +653,44 @@ class CircularChromosomeCompressor:
         # Find next prime for optimal ring size to avoid periodic artifacts
         prime_length = self._next_prime(length)
         padding_size = prime_length - length
-        
+
         self._log(f"Circular padding size = {padding_size} (prime length: {prime_length})")
-        
-        # Pad with zeros if needed
-        padded = compressed + [0] * padding_size
-        
-        # Create bridge for circular continuity
-        bridge_length = min(int(math.sqrt(prime_length)), 10)
-        bridge = padded[:bridge_length]
-        
+
+        # Bridge for circular continuity (isqrt: exact integer root, no
+        # float round trip)
+        bridge_length = min(math.isqrt(prime_length), 10)
+
         self._log(f"Bridge length = {bridge_length}")
-        
-        # Create circular structure
-        circular_ring = padded + bridge
-        
+
+        # Build the ring in a single pre-sized buffer: data + zero padding + bridge.
+        # Avoids the repeated list reallocations of data + [0]*pad + bridge.
+        ring = np.empty(prime_length + bridge_length, dtype=np.int32)
+        ring[:length] = compressed
+        ring[length:prime_length] = 0
+        ring[prime_length:] = ring[:bridge_length]
+
+        circular_ring = ring.tolist()
+
         self._log(f"Circular encapsulation completed: {length} → {len(circular_ring)} codes")
         return circular_ring
     
+    def _marker_conflict_scan(self, data: List[int], marker_code: int) -> int:
+        """
+        Count occurrences of a marker code in a code stream in one pass.
+
+        Args:
+            data: List of integer codes to scan
+            marker_code: Candidate spliced leader marker code
+
+        Returns:
+            Number of times marker_code appears in data
+        """
+        if not data:
+            return 0
+
+        arr = np.asarray(data, dtype=np.int64)
+        return int((arr == marker_code).sum())
+
     def add_trans_splicing_markers(self, circular_data: List[int], original_compressed_length: int = None) -> Tuple[List, Dict]:
         """
         Add trans-splicing markers for error correction and decoding guidance.
@@ -480,43 +708,36 @@ class CircularChromosomeCompressor:
             
         # Generate spliced leader marker that doesn't conflict with data
         data_hash = self._compute_data_hash(circular_data)
-        
-        # Find a marker code that doesn't exist in the data
-        max_value = max(circular_data) if circular_data else 0
-        data_set = set(circular_data)
-        
-        # Start with a value guaranteed to be outside the data range
-        sl_marker_code = max_value + 1
-        
-        # Double-check it doesn't conflict (though it shouldn't)
-        while sl_marker_code in data_set:
-            sl_marker_code += 1
-        
-        marked_data = []
-        marker_positions = []
-        
-        # Insert markers at regular intervals
-        for i in range(0, len(circular_data), self.chunk_size):
-            chunk = circular_data[i:i+self.chunk_size]
-            
-            # Add marker before chunk
-            marked_data.append(sl_marker_code)
-            marker_positions.append(len(marked_data) - 1)
-            
-            # Add chunk data
-            marked_data.extend(chunk)
-        
+
+        # One vectorized max() pass gives a marker guaranteed to be outside
+        # the data range, so no membership rescan over the codes is needed
+        arr = np.asarray(circular_data, dtype=np.int64)
+        sl_marker_code = int(arr.max()) + 1
+
+        # Insert a marker before every chunk_size codes. Marker positions are
+        # arithmetic (one marker per chunk stride), so the interleave is a
+        # single preallocated buffer with two scatter assignments instead of
+        # a per-chunk slice/extend loop.
+        chunk_size = self.chunk_size
+        n_chunks = -(-arr.size // chunk_size)
+        out = np.empty(arr.size + n_chunks, dtype=np.int64)
+        marker_positions = np.arange(n_chunks) * (chunk_size + 1)
+        marker_mask = np.zeros(out.size, dtype=bool)
+        marker_mask[marker_positions] = True
+        out[marker_mask] = sl_marker_code
+        out[~marker_mask] = arr
+
         # Metadata for decoding
         metadata = {
             'sl_marker_code': sl_marker_code,
-            'chunk_size': self.chunk_size,
+            'chunk_size': chunk_size,
             'original_length': len(circular_data),
-            'marker_positions': marker_positions,
+            'marker_positions': marker_positions.tolist(),
             'data_hash': data_hash,
             'original_compressed_length': original_compressed_length if original_compressed_length is not None else len(circular_data)
         }
-        
-        return marked_data, metadata
+
+        return out.tolist(), metadata
     
     def compress_core(self, binary_data: bytes) -> Tuple[List[int], Dict]:
         """
@@ -533,11 +754,12 @@ class CircularChromosomeCompressor:
             
         self._log(f"Starting core compression for {len(binary_data)} bytes")
         
-        # Step 1: Convert binary to DNA
-        dna_seq = self.binary_to_dna(binary_data)
-        
+        # Step 1: Convert binary to DNA (ASCII bytes; dvnp_compress works on
+        # raw bytes, so the Seq/str round trip is skipped on this hot path)
+        dna_seq = self._binary_to_dna_bytes(binary_data)
+
         # Step 2: DVNP compression
-        compressed = self.dvnp_compress(str(dna_seq))
+        compressed = self.dvnp_compress(dna_seq)
         
         # Core layer metadata
         core_metadata = {
@@ -607,6 +829,44 @@ class CircularChromosomeCompressor:
         
         return final_data, metadata
     
+    def _strip_markers_and_padding(self, data: List[int], marker_code: int,
+                                   original_length: int,
+                                   original_compressed_length: int) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Fused marker filter and circular-padding strip on a single array view.
+
+        Runs the spliced-leader filter, the encapsulation truncate and the
+        padding/bridge strip as slices of one int64 array, so no intermediate
+        Python lists are materialized between the stages.
+
+        Args:
+            data: Marked code stream
+            marker_code: Spliced leader marker code to remove
+            original_length: Circular data length before markers were added,
+                or None to default to the filtered length
+            original_compressed_length: Compressed length before encapsulation,
+                or None to default to original_length
+
+        Returns:
+            Tuple of (encapsulated data, core compressed data, lengths_consistent)
+        """
+        arr = np.asarray(data, dtype=np.int64)
+        filtered = arr[arr != marker_code]
+
+        if original_length is None:
+            original_length = filtered.size
+        if original_compressed_length is None:
+            original_compressed_length = original_length
+
+        if original_length <= filtered.size:
+            encapsulated = filtered[:original_length]
+            core = encapsulated[:original_compressed_length]
+            return encapsulated, core, True
+
+        # Fallback - shouldn't happen in normal cases
+        core = filtered[:original_compressed_length] if original_compressed_length <= filtered.size else filtered
+        return filtered, core, False
+
     def decapsulate(self, marked_data: List[int], encap_metadata: Dict) -> List[int]:
         """
         Decapsulation layer: Remove trans-splicing markers and circular encapsulation.
@@ -622,34 +882,44 @@ class CircularChromosomeCompressor:
         if not marked_data or not encap_metadata:
             return []
             
-        # Step 1: Remove trans-splicing markers
+        # Hoist all metadata lookups into locals once, up front
         ts_metadata = encap_metadata.get('trans_splicing', {})
         marker_code = ts_metadata.get('sl_marker_code', 0)
-        
-        # Filter out markers
-        filtered_data = [x for x in marked_data if x != marker_code]
-        
-        # Step 2: Remove bridge elements and zero padding from circular encapsulation
-        original_length = ts_metadata.get('original_length', len(filtered_data))
-        original_compressed_length = ts_metadata.get('original_compressed_length', original_length)
-        
-        if original_length <= len(filtered_data):
-            # Get the encapsulated data (without trans-splicing markers)
-            encapsulated_data = filtered_data[:original_length]
-            
-            # Step 3: Hash verification for data integrity
-            stored_hash = ts_metadata.get('data_hash', '')
+        original_length = ts_metadata.get('original_length')
+        original_compressed_length = ts_metadata.get('original_compressed_length')
+        stored_hash = ts_metadata.get('data_hash', '')
+
+        # Fused marker filter + padding/bridge strip
+        encapsulated_data, core_data, consistent = self._strip_markers_and_padding(
+            marked_data, marker_code, original_length, original_compressed_length)
+
+        if consistent:
+            # Hash verification for data integrity
             self._verify_data_integrity(encapsulated_data, stored_hash, "decapsulation")
-            
-            # Extract only the original compressed data, excluding zero padding and bridge elements
-            core_data = encapsulated_data[:original_compressed_length]
         else:
-            # Fallback - shouldn't happen in normal cases
-            core_data = filtered_data[:original_compressed_length] if original_compressed_length <= len(filtered_data) else filtered_data
             self._log("[CCC Warning] Data length inconsistency detected during decapsulation")
-        
-        return core_data
+
+        return core_data.tolist()
     
+    def _fit_to_size(self, binary_data: bytes, expected_size: int) -> bytes:
+        """
+        Truncate or zero-pad decoded bytes to the expected original size.
+
+        Args:
+            binary_data: Decoded binary data
+            expected_size: Original data size in bytes
+
+        Returns:
+            Binary data of exactly expected_size bytes
+        """
+        if len(binary_data) > expected_size:
+            # Truncate extra bytes
+            return binary_data[:expected_size]
+        if len(binary_data) < expected_size:
+            # Pad with zeros if needed (this shouldn't normally happen)
+            return binary_data + b'\x00' * (expected_size - len(binary_data))
+        return binary_data
+
     def decompress_core(self, compressed: List[int], core_metadata: Dict) -> bytes:
         """
         Core decompression algorithm layer: DVNP decompression → DNA → Binary.
@@ -667,23 +937,17 @@ class CircularChromosomeCompressor:
             
         self._log(f"Starting core decompression for {len(compressed)} codes")
             
-        # Step 1: DVNP decompression
-        dna_sequence = self.dvnp_decompress(compressed)
-        
-        # Step 2: Convert DNA back to binary
-        binary_data = self.dna_to_binary(dna_sequence)
-        
+        # Step 1: DVNP decompression to ASCII bytes (the decoder only ever
+        # emits valid bases, so the str round trip and re-validation that
+        # dvnp_decompress + dna_to_binary would do are skipped)
+        dna_sequence = self._dvnp_decompress_bases(compressed)
+
+        # Step 2: Pack DNA bases back to binary
+        binary_data = self._dna_bases_to_binary(dna_sequence)
+
         # Step 3: Ensure exact original length
         expected_size = core_metadata.get('original_size', len(binary_data))
-        if len(binary_data) > expected_size:
-            # Truncate extra bytes
-            binary_data = binary_data[:expected_size]
-        elif len(binary_data) < expected_size:
-            # Pad with zeros if needed (this shouldn't normally happen)
-            padding_needed = expected_size - len(binary_data)
-            binary_data = binary_data + b'\x00' * padding_needed
-        
-        return binary_data
+        return self._fit_to_size(binary_data, expected_size)
     
     def decompress(self, compressed_data: List[int], metadata: Dict) -> bytes:
         """
@@ -715,47 +979,74 @@ class CircularChromosomeCompressor:
             binary_data = self.decompress_core(core_data, core_metadata)
             
         else:
-            # Legacy flat metadata structure for backward compatibility
+            # Legacy flat metadata structure for backward compatibility.
+            # Hoist all metadata lookups into locals once, up front
             ts_metadata = metadata.get('trans_splicing', {})
             marker_code = ts_metadata.get('sl_marker_code', 0)
-            
-            # Filter out markers
-            filtered_data = [x for x in compressed_data if x != marker_code]
-            
-            # Remove bridge elements and zero padding
-            original_length = ts_metadata.get('original_length', len(filtered_data))
-            original_compressed_length = ts_metadata.get('original_compressed_length', original_length)
-            
-            if original_length <= len(filtered_data):
-                encapsulated_data = filtered_data[:original_length]
-                circular_data = encapsulated_data[:original_compressed_length]
-            else:
-                circular_data = filtered_data[:original_compressed_length] if original_compressed_length <= len(filtered_data) else filtered_data
-            
-            # DVNP decompression
-            dna_sequence = self.dvnp_decompress(circular_data)
-            
+            original_length = ts_metadata.get('original_length')
+            original_compressed_length = ts_metadata.get('original_compressed_length')
+
+            # Fused marker filter + padding/bridge strip
+            _, circular_data, _ = self._strip_markers_and_padding(
+                compressed_data, marker_code, original_length, original_compressed_length)
+
+            # DVNP decompression straight to ASCII bytes, then pack — the
+            # decoder's output needs no re-validation
+            dna_sequence = self._dvnp_decompress_bases(circular_data.tolist())
+
             # Convert DNA back to binary
-            binary_data = self.dna_to_binary(dna_sequence)
-            
+            binary_data = self._dna_bases_to_binary(dna_sequence)
+
             # Ensure exact original length
             expected_size = metadata.get('original_size', len(binary_data))
-            if len(binary_data) > expected_size:
-                binary_data = binary_data[:expected_size]
-            elif len(binary_data) < expected_size:
-                padding_needed = expected_size - len(binary_data)
-                binary_data = binary_data + b'\x00' * padding_needed
-        
+            binary_data = self._fit_to_size(binary_data, expected_size)
+
         return binary_data
     
-    def get_compression_stats(self, original_data: bytes, compressed_result) -> Dict:
+    @staticmethod
+    def pack_codes(codes: List[int]) -> bytes:
+        """
+        Pack a code stream into its compact little-endian wire form.
+
+        The in-memory pipeline exchanges List[int] for API stability, but a
+        boxed Python int costs ~28 bytes; this packs each code into 4 bytes
+        for storage or transmission. Marker codes can exceed 16 bits (the
+        spliced-leader marker is max_code + 1), so uint32 is the narrowest
+        safe fixed width.
+
+        Args:
+            codes: Compressed codes as produced by the pipeline
+
+        Returns:
+            Little-endian uint32 byte string
+        """
+        return np.asarray(codes, dtype='<u4').tobytes()
+
+    @staticmethod
+    def unpack_codes(buf: bytes) -> List[int]:
+        """
+        Inverse of pack_codes(): recover the List[int] code stream.
+
+        Args:
+            buf: Little-endian uint32 byte string from pack_codes()
+
+        Returns:
+            Compressed codes as a list of Python ints
+        """
+        return np.frombuffer(buf, dtype='<u4').tolist()
+
+    def get_compression_stats(self, original_data: bytes, compressed_result,
+                              include_compressed_entropy: bool = True) -> Dict:
         """
         Calculate compression statistics and efficiency metrics with Shannon entropy analysis.
-        
+
         Args:
             original_data: Original binary data
             compressed_result: Either compressed data (List[int]) or complete result (Tuple[List[int], Dict])
-            
+            include_compressed_entropy: If False, skip the compressed-stream
+                entropy pass (it is reporting-only; no efficiency metric uses
+                it) and omit the compressed_entropy/entropy_reduction fields
+
         Returns:
             Dictionary with compression statistics including entropy analysis
         """
@@ -770,34 +1061,44 @@ class CircularChromosomeCompressor:
         
         # More accurate size calculation: determine bits needed per code
         if compressed_data:
-            max_code = max(compressed_data) if compressed_data else 0
+            codes = np.asarray(compressed_data, dtype=np.int64)
+            max_code = int(codes.max())
             bits_per_code = max(16, (max_code.bit_length() + 7) // 8 * 8)  # Round up to byte boundary, min 16-bit
             compressed_size_bits = len(compressed_data) * bits_per_code
             compressed_size = compressed_size_bits // 8
         else:
+            codes = None
+            max_code = 0
             compressed_size = 0
             bits_per_code = 16
-        
+
         # Calculate DNA sequence length for bits per base calculation
         dna_length = original_size * 4  # 2 bits per base -> 4 bases per byte
-        
+
         # Calculate Shannon entropy and efficiency metrics
         original_entropy = self._entropy(original_data)
-        
-        # For compressed entropy, we need to handle integer codes properly
-        if compressed_data:
-            # Convert integer codes to bytes representation for entropy calculation
-            compressed_bytes = []
-            for code in compressed_data:
-                # Convert each code to bytes (using little-endian encoding)
-                code_bytes = code.to_bytes((code.bit_length() + 7) // 8 or 1, 'little')
-                compressed_bytes.extend(code_bytes)
-            compressed_entropy = self._entropy(bytes(compressed_bytes))
+
+        # For compressed entropy, we need to handle integer codes properly.
+        # This pass is purely informational, so callers on hot paths (e.g.
+        # benchmarks) can opt out of the byte packing + entropy scan entirely.
+        if include_compressed_entropy and compressed_data:
+            # View the code array as little-endian bytes in one step instead
+            # of a per-code to_bytes loop; the narrowest dtype that fits
+            # max_code keeps the byte stream close to the variable-width
+            # encoding the entropy used to be measured on
+            if max_code < 1 << 8:
+                byte_dtype = '<u1'
+            elif max_code < 1 << 16:
+                byte_dtype = '<u2'
+            else:
+                byte_dtype = '<u4'
+            compressed_bytes = codes.astype(byte_dtype).view(np.uint8)
+            compressed_entropy = self._entropy(compressed_bytes.tobytes())
         else:
             compressed_entropy = 0.0
-            
+
         entropy_reduction = original_entropy - compressed_entropy
-        
+
         theoretical_min_size = (original_entropy * original_size) / 8 if original_size > 0 else 0
         shannon_efficiency = theoretical_min_size / compressed_size if compressed_size > 0 else 0
         
@@ -827,14 +1128,16 @@ class CircularChromosomeCompressor:
             'bits_per_base': (compressed_size * 8) / dna_length if dna_length > 0 else 0,
             'bits_per_code': bits_per_code,
             'total_codes': len(compressed_data),
-            'max_code_value': max(compressed_data) if compressed_data else 0,
+            'max_code_value': max_code,
             # Shannon entropy analysis
             'original_entropy': original_entropy,
-            'compressed_entropy': compressed_entropy,
-            'entropy_reduction': entropy_reduction,
             'theoretical_minimum_size': theoretical_min_size,
             'shannon_efficiency': min(1.0, shannon_efficiency),  # Cap at 1.0
             'compression_effectiveness': min(1.0, max(0.0, compression_effectiveness))  # Keep between 0.0 and 1.0
         }
-        
+
+        if include_compressed_entropy:
+            stats['compressed_entropy'] = compressed_entropy
+            stats['entropy_reduction'] = entropy_reduction
+
         return stats
@@ -3,26 +3,83 @@ Utility functions for the Circular Chromosome Compression algorithm.
 Provides helper functions for data validation, analysis, and processing.
 """
 
+import functools
 import os
 import json
 import pickle
+import struct
 from typing import Any, Dict, List, Optional, Tuple
 import hashlib
 from pathlib import Path
 
+import numpy as np
 
-def validate_dna_sequence(sequence: str) -> bool:
+from .circular_chromosome_compression import CircularChromosomeCompressor
+
+# Magic prefix of the framed CCC container written by save_compressed_data:
+# b"CCC1" | u32 metadata length | JSON metadata | u32 code count | raw codes
+# as little-endian uint32. Files without the prefix are legacy pickles.
+_CCC_MAGIC = b"CCC1"
+
+# Validity tables for DNA byte classification: valid bytes map to 0x01,
+# everything else to 0x00, so a whole sequence is checked with one C-level
+# translate pass instead of a per-character Python loop. One table per
+# validation mode keeps the fast path branch-free regardless of mode:
+#   strict    - canonical ACGT only
+#   iupac     - adds the IUPAC ambiguity codes (N, R, Y, ...)
+#   iupac_gap - additionally allows gap/unknown characters '-', '.' and ' '
+def _build_valid_table(extra_letters: bytes = b"", symbols: bytes = b"") -> bytes:
+    letters = b"ACGT" + extra_letters
+    alphabet = letters + letters.lower() + symbols
+    return bytes(1 if c in alphabet else 0 for c in range(256))
+
+
+_DNA_VALID_TABLES = {
+    'strict': _build_valid_table(),
+    'iupac': _build_valid_table(b"RYSWKMBDHVN"),
+    'iupac_gap': _build_valid_table(b"RYSWKMBDHVN", b"-. "),
+}
+
+# GC classification table: G/C (either case) map to 0x01, all else to 0x00,
+# so GC content is one translate pass plus one count.
+_GC_TABLE = bytes(1 if c in b"GCgc" else 0 for c in range(256))
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of path if it does not exist yet."""
+    parent = os.path.dirname(path)
+    if parent:
+        # exist_ok lets the kernel handle the already-exists case in one
+        # mkdir call instead of a stat round trip per write
+        os.makedirs(parent, exist_ok=True)
+
+
+def validate_dna_sequence(sequence: str, mode: str = 'strict') -> bool:
     """
     Validate that a sequence contains only valid DNA bases.
-    
+
     Args:
         sequence: DNA sequence string to validate
-        
+        mode: Validation alphabet — 'strict' for canonical ACGT only,
+            'iupac' to also accept IUPAC ambiguity codes (N, R, Y, ...),
+            'iupac_gap' to additionally accept gap characters ('-', '.', ' ')
+
     Returns:
         True if sequence is valid, False otherwise
+
+    Raises:
+        ValueError: If mode is not a known validation mode
     """
-    valid_bases = set('ACGT')
-    return all(base.upper() in valid_bases for base in sequence)
+    try:
+        table = _DNA_VALID_TABLES[mode]
+    except KeyError:
+        raise ValueError(f"Unknown validation mode: {mode!r}") from None
+    try:
+        encoded = sequence.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+    # One translate pass classifies every byte; any 0 byte marks an invalid base
+    return encoded.translate(table).find(0) == -1
 
 
 def calculate_gc_content(sequence: str) -> float:
@@ -37,8 +94,10 @@ def calculate_gc_content(sequence: str) -> float:
     """
     if not sequence:
         return 0.0
-    
-    gc_count = sequence.upper().count('G') + sequence.upper().count('C')
+
+    # One C-level classify pass + one count instead of two upper() copies
+    # and two separate count() scans
+    gc_count = sequence.encode('ascii').translate(_GC_TABLE).count(1)
     return (gc_count / len(sequence)) * 100
 
 
@@ -53,12 +112,43 @@ def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
     Returns:
         Hexadecimal hash string
     """
+    # Key the cache on (path, size, mtime) so repeated hashing of an
+    # unchanged file — e.g. report generation inside a benchmark sweep —
+    # skips the I/O entirely. A file mutated in place within mtime
+    # granularity without a size change can serve a stale digest; callers
+    # needing a guaranteed fresh read can call _hash_file directly.
+    st = os.stat(file_path)
+    return _file_digest(os.path.abspath(file_path), st.st_size, st.st_mtime_ns, algorithm)
+
+
+@functools.lru_cache(maxsize=256)
+def _file_digest(file_path: str, size: int, mtime_ns: int, algorithm: str) -> str:
+    """Cached wrapper around _hash_file; size/mtime_ns only serve as cache keys."""
+    return _hash_file(file_path, algorithm)
+
+
+def _hash_file(file_path: str, algorithm: str) -> str:
+    """Hash a file's contents, always reading from disk (no caching)."""
+    # Python 3.11+: the whole streaming loop runs in C with no Python-level
+    # round trip per buffer
+    if hasattr(hashlib, 'file_digest'):
+        with open(file_path, 'rb') as f:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
     hash_obj = hashlib.new(algorithm)
-    
+
+    # Read into one reusable 1 MiB buffer: ~256x fewer syscalls and update
+    # dispatches than 4 KiB chunks, and buffers this size let hashlib
+    # release the GIL during update
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_obj.update(chunk)
-    
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hash_obj.update(view[:n])
+
     return hash_obj.hexdigest()
 
 
@@ -71,19 +161,25 @@ def save_compressed_data(compressed_data: List[int], metadata: Dict, output_path
         metadata: Compression metadata dictionary
         output_path: Output file path
     """
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    data_to_save = {
-        'compressed_data': compressed_data,
+    _ensure_parent_dir(output_path)
+
+    # Framed binary container: JSON for the (small) metadata, and the code
+    # list packed via pack_codes() into raw little-endian uint32 instead of
+    # a pickled list of boxed ints — far smaller on disk and loadable
+    # without per-int deserialization
+    meta_blob = json.dumps({
         'metadata': metadata,
         'version': '1.0',
         'algorithm': 'CCC'
-    }
-    
+    }).encode('utf-8')
+    payload = CircularChromosomeCompressor.pack_codes(compressed_data)
+
     with open(output_path, 'wb') as f:
-        pickle.dump(data_to_save, f)
+        f.write(_CCC_MAGIC)
+        f.write(struct.pack('<I', len(meta_blob)))
+        f.write(meta_blob)
+        f.write(struct.pack('<I', len(compressed_data)))
+        f.write(payload)
 
 
 def load_compressed_data(input_path: str) -> Tuple[List[int], Dict]:
@@ -102,13 +198,26 @@ def load_compressed_data(input_path: str) -> Tuple[List[int], Dict]:
     """
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
-    
+
     with open(input_path, 'rb') as f:
+        magic = f.read(4)
+        if magic == _CCC_MAGIC:
+            (meta_len,) = struct.unpack('<I', f.read(4))
+            meta = json.loads(f.read(meta_len).decode('utf-8'))
+            (n_codes,) = struct.unpack('<I', f.read(4))
+            payload = f.read(n_codes * 4)
+            if 'metadata' not in meta or len(payload) != n_codes * 4:
+                raise ValueError("Invalid compressed file format")
+            compressed_data = CircularChromosomeCompressor.unpack_codes(payload)
+            return compressed_data, meta['metadata']
+
+        # Legacy pickle container written by older versions
+        f.seek(0)
         data = pickle.load(f)
-    
+
     if not isinstance(data, dict) or 'compressed_data' not in data or 'metadata' not in data:
         raise ValueError("Invalid compressed file format")
-    
+
     return data['compressed_data'], data['metadata']
 
 
@@ -121,18 +230,25 @@ def export_dna_sequence(sequence: str, output_path: str, format: str = 'fasta')
         output_path: Output file path
         format: Output format ('fasta', 'raw')
     """
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    with open(output_path, 'w') as f:
+    _ensure_parent_dir(output_path)
+
+    with open(output_path, 'wb') as f:
         if format.lower() == 'fasta':
-            f.write(f">CCC_Compressed_Sequence\n")
-            # Write sequence in 80-character lines (standard FASTA format)
-            for i in range(0, len(sequence), 80):
-                f.write(f"{sequence[i:i+80]}\n")
+            # Vectorized line wrap: copy the full 80-column lines into a
+            # 81-wide block whose last column is '\n', so the whole body is
+            # one reshape-and-memcpy instead of one slice per line, then
+            # write the record once
+            seq_bytes = sequence.encode('ascii')
+            full, tail = divmod(len(seq_bytes), 80)
+            block = np.empty((full, 81), dtype=np.uint8)
+            block[:, :80] = np.frombuffer(seq_bytes[:full * 80], dtype=np.uint8).reshape(full, 80)
+            block[:, 80] = ord('\n')
+            body = block.tobytes()
+            if tail:
+                body += seq_bytes[full * 80:] + b'\n'
+            f.write(b">CCC_Compressed_Sequence\n" + body)
         else:  # raw format
-            f.write(sequence)
+            f.write(sequence.encode('ascii'))
 
 
 def analyze_compression_efficiency(original_size: int, compressed_size: int, 
@@ -167,7 +283,46 @@ def analyze_compression_efficiency(original_size: int, compressed_size: int,
     }
 
 
-def create_compression_report(original_file: str, compressed_file: str, 
+def analyze_many(original_sizes: List[int], compressed_sizes: List[int],
+                 dna_lengths: List[int]) -> Dict[str, np.ndarray]:
+    """
+    Batched variant of analyze_compression_efficiency for many results.
+
+    Computes every metric with NumPy broadcasting in one pass, so sweeps
+    over thousands of (original, compressed, dna_length) triples avoid a
+    per-call dict allocation and Python-level division.
+
+    Args:
+        original_sizes: Original data sizes in bytes (must be non-zero)
+        compressed_sizes: Compressed data sizes in bytes
+        dna_lengths: Lengths of the corresponding DNA sequences
+
+    Returns:
+        Dictionary mapping each metric name to an aligned ndarray
+    """
+    orig = np.asarray(original_sizes, dtype=np.float64)
+    comp = np.asarray(compressed_sizes, dtype=np.float64)
+    dna = np.asarray(dna_lengths, dtype=np.float64)
+
+    if np.any(orig == 0):
+        raise ValueError("Cannot analyze zero-size input")
+
+    compression_ratio = comp / orig
+    space_savings = (1 - compression_ratio) * 100
+    bits_per_base = np.where(dna > 0, (comp * 8) / np.maximum(dna, 1), 0.0)
+    shannon_efficiency = np.where(
+        bits_per_base > 0, (2.0 / np.maximum(bits_per_base, 1e-12)) * 100, 0.0)
+
+    return {
+        'compression_ratio': compression_ratio,
+        'space_savings_percent': space_savings,
+        'bits_per_base': bits_per_base,
+        'shannon_efficiency_percent': np.minimum(shannon_efficiency, 100),
+        'theoretical_optimal': bits_per_base <= 2.0
+    }
+
+
+def create_compression_report(original_file: str, compressed_file: str,
                             stats: Dict, output_path: Optional[str] = None) -> str:
     """
     Create a detailed compression report.
@@ -227,6 +382,10 @@ def verify_decompression_integrity(original_data: bytes, decompressed_data: byte
     Returns:
         True if data matches, False otherwise
     """
+    # O(1) length pre-check before the byte compare; the compare itself is
+    # a single C-level memcmp, which beats hashing both sides
+    if len(original_data) != len(decompressed_data):
+        return False
     return original_data == decompressed_data
 
 
@@ -258,66 +417,99 @@ def estimate_dna_synthesis_cost(sequence_length: int, cost_per_base: float = 0.1
     }
 
 
-def benchmark_compression_speed(compressor, test_data_sizes: List[int]) -> Dict[int, Dict[str, float]]:
+def _generate_benchmark_data(size: int) -> bytes:
+    """Build the cyclic benchmark test vector for one size."""
+    # np.resize repeats the pattern cyclically into one preallocated
+    # buffer, replacing the multiply-then-concatenate construction that
+    # briefly held two size-scale byte strings
+    byte_cycle = np.arange(256, dtype=np.uint8)
+    if size >= 1048576:  # For files >= 1MB, use pattern-based generation
+        pattern_size = min(4096, size // 1000)  # Reasonable pattern size
+        pattern = np.resize(byte_cycle, pattern_size)
+        return np.resize(pattern, size).tobytes()
+    return np.resize(byte_cycle, size).tobytes()
+
+
+def _benchmark_one(compressor, size: int) -> Dict[str, float]:
+    """Run the compression/decompression benchmark for a single size.
+
+    Module-level so ProcessPoolExecutor can pickle it for parallel sweeps.
+    """
+    import time
+    import gc
+
+    test_data = _generate_benchmark_data(size)
+
+    # Force garbage collection before benchmark
+    gc.collect()
+
+    # Benchmark compression with the monotonic high-resolution clock;
+    # deltas stay in integer nanoseconds until the final division
+    start_ns = time.perf_counter_ns()
+    compressed_data, metadata = compressor.compress(test_data)
+    compression_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+    # Benchmark decompression
+    start_ns = time.perf_counter_ns()
+    decompressed_data = compressor.decompress(compressed_data, metadata)
+    decompression_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+    # Calculate throughput
+    compression_throughput = size / compression_time if compression_time > 0 else 0
+    decompression_throughput = size / decompression_time if decompression_time > 0 else 0
+
+    # Verify integrity
+    integrity_ok = verify_decompression_integrity(test_data, decompressed_data)
+
+    return {
+        'compression_time_sec': compression_time,
+        'decompression_time_sec': decompression_time,
+        'compression_throughput_bytes_sec': compression_throughput,
+        'decompression_throughput_bytes_sec': decompression_throughput,
+        'total_time_sec': compression_time + decompression_time,
+        'integrity_verified': integrity_ok
+    }
+
+
+def benchmark_compression_speed(compressor, test_data_sizes: List[int],
+                                parallel: bool = False) -> Dict[int, Dict[str, float]]:
     """
     Benchmark compression speed with different data sizes.
-    
+
     Args:
         compressor: CircularChromosomeCompressor instance
         test_data_sizes: List of test data sizes in bytes
-        
+        parallel: Run the sizes concurrently in worker processes. Finishes a
+            sweep in roughly the time of its slowest size, but concurrent
+            workers share memory bandwidth and cores, so per-size timings
+            are less faithful than a serial run
+
     Returns:
         Dictionary mapping data size to performance metrics
     """
-    import time
     import gc
-    
+
+    def _describe(size):
+        return (f"Benchmarking {size//1048576}MB..." if size >= 1048576
+                else f"Benchmarking {size//1024}KB..." if size >= 1024
+                else f"Benchmarking {size}B...")
+
+    if parallel:
+        from concurrent.futures import ProcessPoolExecutor
+
+        for size in test_data_sizes:
+            print(_describe(size))
+        max_workers = min(len(test_data_sizes), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {size: executor.submit(_benchmark_one, compressor, size)
+                       for size in test_data_sizes}
+            return {size: future.result() for size, future in futures.items()}
+
     results = {}
-    
     for size in test_data_sizes:
-        print(f"Benchmarking {size//1048576}MB..." if size >= 1048576 else f"Benchmarking {size//1024}KB..." if size >= 1024 else f"Benchmarking {size}B...")
-        
-        # Generate test data - use more efficient pattern for large files
-        if size >= 1048576:  # For files >= 1MB, use pattern-based generation
-            pattern_size = min(4096, size // 1000)  # Reasonable pattern size
-            pattern = bytes(range(256)) * (pattern_size // 256) + bytes(range(pattern_size % 256))
-            test_data = (pattern * (size // len(pattern))) + pattern[:size % len(pattern)]
-        else:
-            test_data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
-        
-        # Force garbage collection before benchmark
-        gc.collect()
-        
-        # Benchmark compression
-        start_time = time.time()
-        compressed_data, metadata = compressor.compress(test_data)
-        compression_time = time.time() - start_time
-        
-        # Benchmark decompression
-        start_time = time.time()
-        decompressed_data = compressor.decompress(compressed_data, metadata)
-        decompression_time = time.time() - start_time
-        
-        # Calculate throughput
-        compression_throughput = size / compression_time if compression_time > 0 else 0
-        decompression_throughput = size / decompression_time if decompression_time > 0 else 0
-        
-        # Verify integrity
-        integrity_ok = verify_decompression_integrity(test_data, decompressed_data)
-        
-        results[size] = {
-            'compression_time_sec': compression_time,
-            'decompression_time_sec': decompression_time,
-            'compression_throughput_bytes_sec': compression_throughput,
-            'decompression_throughput_bytes_sec': decompression_throughput,
-            'total_time_sec': compression_time + decompression_time,
-            'integrity_verified': integrity_ok
-        }
-        
-        # Clean up memory for large files
-        del test_data
-        del compressed_data
-        del decompressed_data
+        print(_describe(size))
+        results[size] = _benchmark_one(compressor, size)
+        # Clean up memory between large runs
         gc.collect()
-    
+
     return results